@@ -0,0 +1,62 @@
+"""
+Converts the statistical error tables pyspk/stat_errors_*.csv into the binary .npy copies
+loaded by pyspk at run time. The CSV files are the source of the tables: re-run this script
+whenever they change.
+
+Usage
+-----
+    python convert_error_tables.py          # (re)generate the .npy tables
+    python convert_error_tables.py --check  # check that the .npy tables match the CSV files
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pyspk')
+SO_VALUES = (200, 500)
+
+
+def load_csv(SO):
+    """
+    Parses the CSV statistical error table for a specific spherical over-density.
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+
+    Returns
+    -------
+    table: array of float
+        table with columns k, f_b, z, n, error_68_m, error_68_p, error_95_m, error_95_p
+    """
+    return np.loadtxt(os.path.join(TABLES_DIR, 'stat_errors_%d.csv' % SO), delimiter=",", skiprows=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert the pyspk statistical error tables to .npy')
+    parser.add_argument('--check', action='store_true',
+                        help='only check that the .npy tables match the CSV files')
+    args = parser.parse_args()
+
+    mismatched = []
+    for SO in SO_VALUES:
+        table = load_csv(SO)
+        npy_path = os.path.join(TABLES_DIR, 'stat_errors_%d.npy' % SO)
+        if args.check:
+            if not os.path.exists(npy_path) or not np.array_equal(np.load(npy_path), table):
+                mismatched.append(npy_path)
+        else:
+            np.save(npy_path, table)
+            print('Wrote %s' % npy_path)
+
+    if mismatched:
+        print('Out of date, re-run convert_error_tables.py: %s' % ', '.join(mismatched))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Compiled kernels for the SP(k) model. These require numba; if it is not installed,
+_compute_sup is None and the NumPy implementation in model.py is used instead.
+"""
+import math as _math
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+def _sup_kernel(logk, f_b, lambda_a, lambda_b, mu_a, mu_b, mu_c, nu_a, nu_b, nu_c, out):
+    """
+    Suppression of the total matter power spectrum, eqs.(5)-(8) in Salcido et al. (2023),
+    evaluated in a single pass over k.
+
+    Parameters
+    ----------
+    logk : array of float
+        log_10 of the co-moving wavenumber in units [h/Mpc]
+    f_b : array of float
+        baryon fraction normalised by the Universal baryon fraction at the optimal mass
+    lambda_a, lambda_b, mu_a, mu_b, mu_c, nu_a, nu_b, nu_c : float
+        best fitting parameters of the SP(k) model at a specific redshift.
+    out : array of float
+        output array with the suppression of the total matter power spectrum
+    """
+    for i in range(logk.size):
+        lk = logk[i]
+        x0 = 1 + lambda_a * _math.exp(lambda_b * lk)
+        x1 = mu_a + (1 - mu_a) / (1 + _math.exp(mu_b * lk + mu_c))
+        t = (lk - nu_b) / nu_c
+        x2 = nu_a * _math.exp(-.5 * t * t)
+        out[i] = x0 - (x0 - x1) * _math.exp(-x2 * f_b[i])
+    return out
+
+
+if _njit is not None:
+    # Fast-math without the 'nnan' and 'ninf' flags: interpolated baryon fractions can be NaN
+    # and must propagate to the output.
+    _compute_sup = _njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})(_sup_kernel)
+else:
+    _compute_sup = None
@@ -3,11 +3,50 @@ from scipy.interpolate import Akima1DInterpolator as _Akima1DInterpolator
 from scipy.interpolate import LinearNDInterpolator as _LinearNDInterpolator
 from .fit_vals import best_fit_vals as _best_fit_vals
 from .fit_vals import limits as _limits
+from ._core import _compute_sup
 import warnings as _warnings
 import pkgutil as _pkgutil
+import io as _io
+from functools import lru_cache as _lru_cache
+from typing import NamedTuple as _NamedTuple
+
+try:
+    import numexpr as _ne
+except ImportError:
+    _ne = None
 
 _warnings.filterwarnings("always", category=UserWarning)
 
+_LN10 = _np.log(10.0)
+
+
+class _Params(_NamedTuple):
+    """
+    Best fitting parameters of the SP(k) model at a specific redshift.
+    """
+    alpha: float
+    beta: float
+    gamma: float
+    lambda_a: float
+    lambda_b: float
+    mu_a: float
+    mu_b: float
+    mu_c: float
+    nu_a: float
+    nu_b: float
+    nu_c: float
+
+
+# Best fit coefficients stacked as (n_params, 3) arrays, in the order of the _Params fields, 
+# so that all the parameters can be evaluated at once for a given redshift.
+_coeff_matrix = {so: _np.array([_best_fit_vals[so][name] for name in _Params._fields])
+                 for so in _best_fit_vals}
+
+# Interpolators for the redshift evolution of the fitting limits coefficients.
+_LIMIT_NAMES = ('min_x0', 'min_x1', 'min_x2', 'max_x0', 'max_x1', 'max_x2')
+_limit_interps = {so: tuple(_Akima1DInterpolator(_limits[so]['z'], _limits[so][name]) for name in _LIMIT_NAMES)
+                  for so in _limits}
+
 
 def _power_law(m_halo, fb_a, fb_pow, fb_pivot=1):
     """
@@ -29,7 +68,9 @@ def _power_law(m_halo, fb_a, fb_pow, fb_pivot=1):
     output: array of float
         baryon fraction normalised by the Universal baryon fraction: f_b / (Omega_b / Omega_m)
     """
-    fb = fb_a * _np.power(m_halo / fb_pivot, fb_pow)
+    # fb_pivot is cast to float, as integers cannot be raised to negative integer powers.
+    scale = fb_a * _np.power(_np.asarray(fb_pivot, dtype=_np.float64), -fb_pow)
+    fb = scale * _np.power(m_halo, fb_pow)
     return fb
 
 
@@ -49,27 +90,27 @@ def _poly_2(x, vals):
     y: array of float
         dependent variable 
     """
-    y = vals[2] * _np.power(x, 2) + vals[1] * x + vals[0] 
+    y = vals[0] + x * (vals[1] + x * vals[2])
     return y
 
 
-def _optimal_mass_funct(k, params):
+def _optimal_mass_funct(logk, params):
     """
     Optimal mass function defined in eq.(2) in Salcido et al. (2023).
 
     Parameters
     ----------
-    k : array of float
-        co-moving wavenumber in units [h/Mpc]
-    prams : dict
-        dictionary containing the best fitting parameters of the SP(k) model at a specific redshift. 
+    logk : array of float
+        log_10 of the co-moving wavenumber in units [h/Mpc]
+    params : _Params
+        named tuple containing the best fitting parameters of the SP(k) model at a specific redshift. 
 
     Returns
     -------
     output: array of float
         log_10 of the optimal mass in M_sun units
     """
-    output = params['alpha'] - (params['alpha'] - params['beta']) * _np.power(k, params['gamma'])
+    output = params.alpha - (params.alpha - params.beta) * _np.exp(params.gamma * logk * _LN10)
     return output
 
 
@@ -102,9 +143,10 @@ def optimal_mass(SO, z, k, verbose=False):
         _warnings.warn('\033[33mScales with k_max > k_ny = 8 [h/Mpc] '
                        'may not be accurately reproduced by the model. \033[0m', stacklevel=2)
 
+    logk = _np.log10(k)
     params = _get_params(SO, z)
-    output = params['alpha'] - (params['alpha'] - params['beta']) * _np.power(k, params['gamma'])
-    return _np.power(10, output)
+    output = _optimal_mass_funct(logk, params)
+    return _np.exp(_LN10 * output)
 
 
 def _lambda_funct(x, params):
@@ -115,15 +157,18 @@ def _lambda_funct(x, params):
     ----------
     k : array of float
         co-moving wavenumber in units [h/Mpc]
-    prams : dict
-        dictionary containing the best fitting parameters of the SP(k) model at a specific redshift. 
+    params : _Params
+        named tuple containing the best fitting parameters of the SP(k) model at a specific redshift. 
 
     Returns
     -------
     output: array of float
         lambda
     """
-    output = 1 + params['lambda_a'] * _np.exp(params['lambda_b'] * x)
+    if _ne is not None:
+        return _ne.evaluate('1 + a * exp(b * x)',
+                            local_dict={'a': params.lambda_a, 'b': params.lambda_b, 'x': x})
+    output = 1 + params.lambda_a * _np.exp(params.lambda_b * x)
     return output
 
 
@@ -135,17 +180,17 @@ def _mu_funct(x, params):
     ----------
     k : array of float
         co-moving wavenumber in units [h/Mpc]
-    prams : dict
-        dictionary containing the best fitting parameters of the SP(k) model at a specific redshift. 
+    params : _Params
+        named tuple containing the best fitting parameters of the SP(k) model at a specific redshift. 
 
     Returns
     -------
     output: array of float
         mu
     """
-    A = params['mu_a']
-    B = 1 - params['mu_a']
-    C = 1 + _np.exp(params['mu_b'] * x + params['mu_c'])
+    A = params.mu_a
+    B = 1 - params.mu_a
+    C = 1 + _np.exp(params.mu_b * x + params.mu_c)
     output = A + (B / C)
     return output
 
@@ -158,20 +203,80 @@ def _nu_func(x, params):
     ----------
     k : array of float
         co-moving wavenumber in units [h/Mpc]
-    prams : dict
-        dictionary containing the best fitting parameters of the SP(k) model at a specific redshift. 
+    params : _Params
+        named tuple containing the best fitting parameters of the SP(k) model at a specific redshift. 
 
     Returns
     -------
     output: array of float
         nu
     """
-    A = params['nu_a']
-    B = _np.exp(-.5 * ((x - params['nu_b']) / params['nu_c']) ** 2)
+    A = params.nu_a
+    B = _np.exp(-.5 * ((x - params.nu_b) / params.nu_c) ** 2)
     output = A * B
     return output
 
 
+def _check_SO(SO):
+    """
+    Checks that the spherical over-density is one of those calibrated in the SP(k) model.
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    """
+    if SO not in _coeff_matrix:
+        raise ValueError('\033[91mSpherical overdensity should be specified. '
+                         'Please use 200 or 500 \033[0m')
+
+
+def _get_limit_coeffs(SO, z):
+    """
+    Interpolates the coefficients of the baryon fraction fitting limits at a specific redshift. 
+    Results for scalar redshifts are cached per (SO, z).
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    z : float or array of float
+        redshift z. Only accepts values of z <= 3
+
+    Returns
+    -------
+    coeffs: tuple of float
+        coefficients (min_x0, min_x1, min_x2, max_x0, max_x1, max_x2) of the lower and upper 
+        fitting limits for the specified SO and z. Arrays shaped as z if z is an array.
+    """
+    if _np.ndim(z) == 0:
+        return _get_limit_coeffs_cached(SO, float(z))
+    _check_SO(SO)
+    return tuple(interp(z) for interp in _limit_interps[SO])
+
+
+@_lru_cache(maxsize=128)
+def _get_limit_coeffs_cached(SO, z):
+    """
+    Cached evaluation of _get_limit_coeffs for a scalar redshift.
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    z : float
+        redshift z. Only accepts values of z <= 3
+
+    Returns
+    -------
+    coeffs: tuple of float
+        coefficients (min_x0, min_x1, min_x2, max_x0, max_x1, max_x2) of the lower and upper 
+        fitting limits for the specified SO and z.
+    """
+    _check_SO(SO)
+    return tuple(float(interp(z)) for interp in _limit_interps[SO])
+
+
 def get_limits(SO, z, m_halo):
     """
     Function that returns the baryon fraction fitting limits as a function of halo mass
@@ -181,8 +286,8 @@ def get_limits(SO, z, m_halo):
     ----------
     SO : int
         spherical over-density. Only accepts 200 or 500
-    z : float
-        redshift z. Only accepts values of z <= 3
+    z : float or array of float
+        redshift z. Only accepts values of z <= 3. Arrays are broadcast against m_halo.
     m_halo: array of float
         halo mass in M_sun units
 
@@ -194,23 +299,48 @@ def get_limits(SO, z, m_halo):
         upper fitting limit for the baryon fraction normalised by the universal baryon fraction
     """
 
-    inter_min_x0 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['min_x0'])
-    inter_min_x1 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['min_x1'])
-    inter_min_x2 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['min_x2'])
+    return _fb_limits(_get_limit_coeffs(SO, z), _np.log10(m_halo))
+
 
-    inter_max_x0 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['max_x0'])
-    inter_max_x1 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['max_x1'])
-    inter_max_x2 = _Akima1DInterpolator(_limits[str(SO)]['z'], _limits[str(SO)]['max_x2'])
+def _fb_limits(coeffs, logm):
+    """
+    Evaluates the baryon fraction fitting limits as a function of log_10 of the halo mass.
+
+    Parameters
+    ----------
+    coeffs : tuple of float
+        coefficients (min_x0, min_x1, min_x2, max_x0, max_x1, max_x2) of the lower and upper 
+        fitting limits, as returned by _get_limit_coeffs. Arrays broadcasting against logm are also accepted.
+    logm: array of float
+        log_10 of the halo mass in M_sun units
 
-    min_fb = 10 ** (inter_min_x0(z) + inter_min_x1(z) * _np.log10(m_halo) + inter_min_x2(z) * _np.log10(m_halo) ** 2)
-    max_fb = 10 ** (inter_max_x0(z) + inter_max_x1(z) * _np.log10(m_halo) + inter_max_x2(z) * _np.log10(m_halo) ** 2)
+    Returns
+    -------
+    min_fb: array of float
+        lower fitting limit for the baryon fraction normalised by the universal baryon fraction
+    max_fb: array of float
+        upper fitting limit for the baryon fraction normalised by the universal baryon fraction
+    """
+    min_x0, min_x1, min_x2, max_x0, max_x1, max_x2 = coeffs
+
+    if _ne is not None:
+        limit = 'scale * exp(ln10 * (x0 + logm * (x1 + logm * x2)))'
+        min_fb = _ne.evaluate(limit, local_dict={'x0': min_x0, 'x1': min_x1, 'x2': min_x2,
+                                                 'logm': logm, 'ln10': _LN10, 'scale': 0.8})
+        max_fb = _ne.evaluate(limit, local_dict={'x0': max_x0, 'x1': max_x1, 'x2': max_x2,
+                                                 'logm': logm, 'ln10': _LN10, 'scale': 1.2})
+    else:
+        min_fb = _np.exp(_LN10 * _poly_2(logm, (min_x0, min_x1, min_x2))) * 0.8
+        max_fb = _np.exp(_LN10 * _poly_2(logm, (max_x0, max_x1, max_x2))) * 1.2
 
-    return min_fb * 0.8, max_fb * 1.2
+    return min_fb, max_fb
 
 
 def _get_params(SO, z):
     """
     Computes the best fit parameters for the SP(k) model at a specific redshift. 
+    Results for scalar redshifts are cached per (SO, z), as sup_model is typically 
+    called repeatedly at the same redshifts.
 
     Parameters
     ----------
@@ -221,19 +351,64 @@ def _get_params(SO, z):
 
     Returns
     -------
-    params: dict
-        best fit parameters for the specified SO and z.
+    params: _Params
+        named tuple with the best fit parameters for the specified SO and z.
     """
-    params = {}
-    try:
-        for param_i in _best_fit_vals[str(SO)]:
-            params[param_i] = _poly_2(1 + z, _best_fit_vals[str(SO)][param_i])
-    except:
-        raise Exception('''\033[91m
-                        Spherical overdensity should be specified. 
-                        Please use 200 or 500 
-                        \033[0m''')
-    return params
+    if _np.ndim(z) == 0:
+        return _get_params_cached(SO, float(z))
+    _check_SO(SO)
+    zp = 1 + _np.asarray(z, dtype=_np.float64)
+    return _Params(*(c[0] + zp * (c[1] + zp * c[2]) for c in _coeff_matrix[SO]))
+
+
+@_lru_cache(maxsize=256)
+def _get_params_cached(SO, z):
+    """
+    Cached evaluation of _get_params for a scalar redshift.
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    z : float
+        redshift z. Only accepts values of z <= 3 
+
+    Returns
+    -------
+    params: _Params
+        named tuple with the best fit parameters for the specified SO and z.
+    """
+    _check_SO(SO)
+    coeffs = _coeff_matrix[SO]
+    zp = 1 + z
+    vals = coeffs[:, 0] + zp * (coeffs[:, 1] + zp * coeffs[:, 2])
+    return _Params(*vals.tolist())
+
+
+@_lru_cache(maxsize=4)
+def _get_error_interp(SO):
+    """
+    Builds the interpolator for the bootstrapped statistical errors of the SP(k) model. 
+    The error tables are triangulated only once per spherical over-density, and are read from 
+    binary .npy copies of the stat_errors_*.csv tables shipped with the package (generated with 
+    convert_error_tables.py).
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+
+    Returns
+    -------
+    interp: LinearNDInterpolator
+        interpolator over (k, f_b, z) returning the -1 sigma, +1 sigma, -2 sigma and +2 sigma 
+        confidence intervals as the columns of its output.
+    """
+    _check_SO(SO)
+    raw_table = _pkgutil.get_data(__name__, 'stat_errors_%d.npy' % SO)
+    table = _np.load(_io.BytesIO(raw_table))
+    coords = table[:, [0, 1, 2]]
+    return _LinearNDInterpolator(coords, table[:, 4:8], rescale=True)
 
 
 def _akino(alpha, beta, gamma, m_halo, z, cosmo):
@@ -306,9 +481,111 @@ def _double_power_law(epsilon, alpha, beta, gamma, m_pivot, m_halo, z, cosmo):
     return A * (B + C)
 
 
+def build_fb_interp(M_halo, fb, extrapolate=False):
+    """
+    Builds the interpolator used by sup_model() for a (binned) fb - M_halo relation. The interpolator 
+    can be passed to sup_model() through fb_interp, to avoid rebuilding it when sup_model() is called 
+    repeatedly with the same binned data.
+
+    Parameters
+    ----------
+    M_halo : array of float
+        array containing the (binned) halo mass for the fb - M-halo relation in M_sun units.
+        For interpolation, out-of-bounds points return NaNs.
+    fb : array of float
+        array containing the (binned) baryon fraction normalised by the universal baryon fraction: 
+        f_b / (Omega_b / Omega_m) for the fb - M-halo relation.
+    extrapolate: boolean, default False
+        Whether to extrapolate to out-of-bounds points based on first and last intervals, or to return NaNs.
+
+    Returns
+    -------
+    fb_interp: Akima1DInterpolator
+        interpolator returning log_10 of the baryon fraction as a function of log_10 of the halo mass.
+    """
+    if M_halo is None or fb is None:
+        raise ValueError('\033[91mWhen using binned data, both halo mass and baryon '
+                         'fraction should be given. '
+                         'Please specify: M_halo (array) and fb (array). \033[0m')
+    try:
+        fb_interp = _Akima1DInterpolator(_np.log10(M_halo), _np.log10(fb))
+    except ValueError:
+        raise ValueError('\033[91mWhen using binned data, both halo mass and baryon '
+                         'fraction should be given as monotonically increasing arrays. '
+                         'Please specify: M_halo (array) and fb (array). \033[0m') from None
+    if extrapolate:
+        fb_interp.extrapolate = True
+    return fb_interp
+
+
+def _check_redshift(z):
+    """
+    Checks that the redshift(s) are within the calibrated range of the SP(k) model. Warns if 
+    z < 0.125, where the model may not be accurate. 
+
+    Parameters
+    ----------
+    z : float or array of float
+        redshift z. Only accepts values of z <= 3
+    """
+    if _np.any(z < 0):
+        raise Exception('\033[91mIncorrect redshift.\033[0m') from None
+        
+    if _np.any(z > 3):
+        raise Exception('\033[91mpy-spk was calibrated up to z = 3.0. '
+                        'Please specify z <= 3.0 \033[0m') from None
+
+    if _np.any(z < 0.125):
+        _warnings.warn('\033[33mpy-spk was calibrated down to z = 0.125. Redshifts '
+                       'z < 0.125 may not be accurately reproduced by the model. \033[0m', stacklevel=3)
+
+
+def _get_k(k_array, k_min, k_max, n):
+    """
+    Returns the co-moving wavenumbers at which the SP(k) model is evaluated, and checks that they
+    are within the calibrated range of the model. 
+
+    Parameters
+    ----------
+    k_array : array of float, optional
+        array containing the desired co-moving wavenumber in units [h/Mpc]. If given, k_min, k_max and n are ignored.
+    k_min : float
+        minimum co-moving wavenumber in units [h/Mpc]
+    k_max : float, max 12
+        maximum co-moving wavenumber in units [h/Mpc].
+    n : int
+        number of equally spaced co-moving wavenumber in log-spaced between k_min and k_max.
+
+    Returns
+    -------
+    k: array of float
+        array with the co-moving wavenumber in units [h/Mpc]
+    logk: array of float
+        log_10 of k
+    """
+    if k_array is not None:
+        k_max = k_array.max()
+        k = k_array
+        logk = _np.log10(k)
+
+    else:
+        logk = _np.linspace(_np.log10(k_min), _np.log10(k_max), n)
+        k = _np.exp(_LN10 * logk)
+
+    if k_max > 12:
+        raise Exception('\033[91mpy-spk was calibrated up to k_max = 12 [h/Mpc] '
+                        'Please specify k_max <= 12 [h/Mpc] \033[0m') from None
+        
+    if k_max > 8:
+        _warnings.warn('\033[33mScales with k_max > k_ny = 8 [h/Mpc] '
+                       'may not be accurately reproduced by the model. \033[0m', stacklevel=3)
+
+    return k, logk
+
+
 def sup_model(SO, z, fb_a=None, fb_pow=None, fb_pivot=1, M_halo=None, fb=None, extrapolate=False,
               epsilon=None, alpha=None, beta=None, gamma=None, m_pivot=None, cosmo=None, 
-              k_array=None, k_min=0.1, k_max=8, n=100, errors=False, verbose=False):
+              k_array=None, k_min=0.1, k_max=8, n=100, errors=False, verbose=False, fb_interp=None):
     """
     Returns the suppression of the total matter power spectrum as a function of scale 'k' using the SP(k) model.
     Automatically selects the required optimal mass as a function of scale and redshift. Requires the baryon 
@@ -337,6 +614,9 @@ def sup_model(SO, z, fb_a=None, fb_pow=None, fb_pivot=1, M_halo=None, fb=None, e
         For interpolation, out-of-bounds points return NaNs.
     extrapolate: boolean, default False
         Whether to extrapolate to out-of-bounds points based on first and last intervals, or to return NaNs.
+    fb_interp : Akima1DInterpolator, optional
+        interpolator for the (binned) fb - M-halo relation as returned by build_fb_interp(). Useful when 
+        calling sup_model() repeatedly with the same binned data. If given, M_halo, fb and extrapolate are ignored.
     epsilon : float
         normalization parameter for double power-law form.
     alpha : float, optional
@@ -386,128 +666,286 @@ def sup_model(SO, z, fb_a=None, fb_pow=None, fb_pivot=1, M_halo=None, fb=None, e
     """
 
 
-    if z < 0:
-        raise Exception('\033[91mIncorrect redshift.\033[0m') from None
-        
-    if z > 3:
-        raise Exception('\033[91mpy-spk was calibrated up to z = 3.0. '
-                        'Please specify z <= 3.0 \033[0m') from None
-
-    if z < 0.125:
-        _warnings.warn('\033[33mpy-spk was calibrated down to z = 0.125. Redshifts '
-                       'z < 0.125 may not be accurately reproduced by the model. \033[0m', stacklevel=2)
-
-    if k_array is not None:
-        k_max = k_array.max()
-        k_min = k_array.min()
-        k = k_array
-
-    else:
-        k = _np.round(_np.logspace(_np.log10(k_min), _np.log10(k_max), n), 6)
-    
-    logk = _np.log10(k)
-
-    if k_max > 12:
-        raise Exception('\033[91mpy-spk was calibrated up to k_max = 12 [h/Mpc] '
-                        'Please specify k_max <= 12 [h/Mpc] \033[0m') from None
-        
-    if k_max > 8:
-        _warnings.warn('\033[33mScales with k_max > k_ny = 8 [h/Mpc] '
-                       'may not be accurately reproduced by the model. \033[0m', stacklevel=2)
-
+    _check_redshift(z)
+    k, logk = _get_k(k_array, k_min, k_max, n)
 
     params = _get_params(SO, z)
 
-    best_mass = _optimal_mass_funct(k, params)
+    best_mass = _optimal_mass_funct(logk, params)
+    m_opt = _np.exp(_LN10 * best_mass)
 
     if (fb_a is not None) or (fb_pow is not None):
         if verbose:
             print('\033[36mUsing power-law fit for fb - M_halo at z=%.3f, ' 
                   'normalised at M_halo = %.2e [M_sun] \033[0m' % (z, fb_pivot))
-        try:
-            f_b = _power_law(10 ** best_mass, fb_a, fb_pow, fb_pivot)
-        except:
-            raise Exception('\033[91mWhen using a power-law, both parameters should be given. '
-                            'Please specify: fb_a and fb_pow \033[0m') from None
-    elif (M_halo is not None) or (fb is not None):
+        if fb_a is None or fb_pow is None:
+            raise ValueError('\033[91mWhen using a power-law, both parameters should be given. '
+                             'Please specify: fb_a and fb_pow \033[0m')
+        f_b = _power_law(m_opt, fb_a, fb_pow, fb_pivot)
+    elif (fb_interp is not None) or (M_halo is not None) or (fb is not None):
         if verbose:
             print('\033[36mUsing binned data for fb - M_halo at z=%.3f \033[0m' % z)
-        try:
-            fb_inter = _Akima1DInterpolator(_np.log10(M_halo), _np.log10(fb))
-            if extrapolate:
-                fb_inter.extrapolate = True
-            f_b = 10 ** fb_inter(best_mass)
-        except:
-            raise Exception('\033[91mWhen using binned data, both halo mass and baryon '
-                            'fraction should be given as monotonically increasing arrays. '
-                            'Please specify: M_halo (array) and fb (array). \033[0m')
+        if fb_interp is None:
+            fb_interp = build_fb_interp(M_halo, fb, extrapolate)
+        f_b = _np.exp(_LN10 * fb_interp(best_mass))
 
     elif (epsilon is not None) or (m_pivot is not None):
         if verbose:
             print('\033[36mUsing double power law for fb - M_halo at z=%.3f \033[0m' % z)
-        try:
-            f_b = _double_power_law(epsilon, alpha, beta, gamma, m_pivot, 10 ** best_mass, z, cosmo)
-        except:
-            raise Exception('\033[91mUsing double power-law. '
-                            'Please specify: epsilon, alpha, beta, gamma, '
-                            'm_pivot and cosmology (cosmo) \033[0m') from None
+        if any(param is None for param in (epsilon, alpha, beta, gamma, m_pivot, cosmo)):
+            raise ValueError('\033[91mUsing double power-law. '
+                             'Please specify: epsilon, alpha, beta, gamma, '
+                             'm_pivot and cosmology (cosmo) \033[0m')
+        f_b = _double_power_law(epsilon, alpha, beta, gamma, m_pivot, m_opt, z, cosmo)
 
     else:
         if verbose:
             print('\033[36mUsing an Akino et al. 2022 power-law fit for fb ' 
                   '- M_halo at z=%.3f. \033[0m' % z)
-        try:
-            f_b = _akino(alpha, beta, gamma, 10 ** best_mass, z, cosmo)
-        except:
-            raise Exception('\033[91mUsing an Akino power-law. '
-                            'Please specify: alpha, beta, gamma, and cosmology (cosmo) \033[0m') from None
+        if any(param is None for param in (alpha, beta, gamma, cosmo)):
+            raise ValueError('\033[91mUsing an Akino power-law. '
+                             'Please specify: alpha, beta, gamma, and cosmology (cosmo) \033[0m')
+        f_b = _akino(alpha, beta, gamma, m_opt, z, cosmo)
 
-    min_fb, max_fb = get_limits(SO, z, 10 ** best_mass)
+    min_fb, max_fb = _fb_limits(_get_limit_coeffs(SO, z), best_mass)
 
     out_min = f_b < min_fb
     out_max = f_b > max_fb
+    mask = out_min | out_max
+
+    if mask.any():
+        if out_min.any():
+            mass_out_min = m_opt[out_min]
+            _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
+                           'fb < lower_limit between %.1e <= M_halo [M_sun] <= %.1e. ' 
+                           'sup_model() will return NaNs within those limits. \033[0m' 
+                           % (mass_out_min.min(), mass_out_min.max()), stacklevel=2)
+
+        if out_max.any():
+            mass_out_max = m_opt[out_max]
+            _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
+                           'fb > upper_limit between %.1e <= M_halo [M_sun] <= %.1e. ' 
+                           'sup_model() will return NaNs within those limits. \033[0m' 
+                           % (mass_out_max.min(), mass_out_max.max()), stacklevel=2)
+
+    if _compute_sup is not None:
+        logk = _np.ascontiguousarray(logk, dtype=_np.float64)
+        sup = _compute_sup(logk, _np.ascontiguousarray(f_b, dtype=_np.float64),
+                           params.lambda_a, params.lambda_b, params.mu_a, params.mu_b,
+                           params.mu_c, params.nu_a, params.nu_b, params.nu_c,
+                           _np.empty_like(logk))
+    else:
+        x0 = _lambda_funct(logk, params)
+
+        if _ne is not None:
+            # mu and nu are inlined, so that lambda (used twice) is the only intermediate array.
+            sup = _ne.evaluate('x0 - (x0 - (mu_a + (1 - mu_a) / (1 + exp(mu_b * logk + mu_c)))) '
+                               '* exp(-nu_a * exp(-0.5 * ((logk - nu_b) / nu_c) ** 2) * f_b)',
+                               local_dict={'x0': x0, 'logk': logk, 'f_b': f_b,
+                                           'mu_a': params.mu_a, 'mu_b': params.mu_b, 'mu_c': params.mu_c,
+                                           'nu_a': params.nu_a, 'nu_b': params.nu_b, 'nu_c': params.nu_c})
+        else:
+            x1 = _mu_funct(logk, params)
+            x2 = _nu_func(logk, params)
+            sup = x0 - (x0 - x1) * _np.exp(-x2 * f_b)
+
+    sup[mask] = _np.nan
+
+    if errors:
+        interp_errors = _get_error_interp(SO)
+
+        z_array = _np.full_like(k, z)
+        data = _np.column_stack([k, f_b, z_array])
+        error_68_m, error_68_p, error_95_m, error_95_p = interp_errors(data).T.copy()
 
-    mass_out_min = best_mass[out_min]
+        return k, sup, error_68_m, error_68_p, error_95_m, error_95_p
+
+    else:
+        return k, sup
 
-    if any(out_min):
-        _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
-                       'fb < lower_limit between %.1e <= M_halo [M_sun] <= %.1e. ' 
-                       'sup_model() will return NaNs within those limits. \033[0m' 
-                       % (10 ** mass_out_min.min(), 10 ** mass_out_min.max()), stacklevel=2)
 
-    mass_out_max = best_mass[out_max]
+def _get_params_batch(SO, zs):
+    """
+    Computes the best fit parameters for the SP(k) model at several redshifts at once. 
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    zs : array of float
+        redshifts z. Only accepts values of z <= 3 
+
+    Returns
+    -------
+    params: _Params
+        named tuple with the best fit parameters for the specified SO, where each parameter is an 
+        array of shape (len(zs), 1) that broadcasts against arrays of k.
+    """
+    _check_SO(SO)
+    coeffs = _coeff_matrix[SO][:, :, None, None]
+    zp = 1 + zs[:, None]
+    return _Params(*(coeffs[:, 0] + zp * (coeffs[:, 1] + zp * coeffs[:, 2])))
 
-    if any(out_max):
-        _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
-                       'fb > upper_limit between %.1e <= M_halo [M_sun] <= %.1e. ' 
-                       'sup_model() will return NaNs within those limits. \033[0m' 
-                       % (10 ** mass_out_max.min(), 10 ** mass_out_max.max()), stacklevel=2)
 
-    mask = _np.logical_or(out_min,out_max)
+def sup_model_batch(SO, zs, fb_a=None, fb_pow=None, fb_pivot=1, fb_interps=None, M_halo=None, fb=None, 
+                    extrapolate=False, epsilon=None, alpha=None, beta=None, gamma=None, m_pivot=None, 
+                    cosmo=None, k_array=None, k_min=0.1, k_max=8, n=100, errors=False, verbose=False):
+    """
+    Returns the suppression of the total matter power spectrum as a function of scale 'k' using the SP(k) model
+    at several redshifts at once. Equivalent to calling sup_model() for each redshift, but the model is 
+    evaluated on a single (len(zs), len(k)) grid. The fb - M_halo relation is given as in sup_model(). For 
+    binned data, one relation (or interpolator) must be given per redshift. 
+
+    Parameters
+    ----------
+    SO : int
+        spherical over-density. Only accepts 200 or 500
+    zs : array of float
+        redshifts z. Only accepts values of z <= 3
+    fb_a : float or array of float, optional
+        power law constant, either common to all redshifts or one per redshift.
+    fb_pow : float or array of float, optional
+        power law exponent, either common to all redshifts or one per redshift.
+    fb_pivot : float or array of float, optional, default 1
+        power law pivot point, either common to all redshifts or one per redshift.
+    fb_interps : sequence of Akima1DInterpolator, optional
+        interpolators for the (binned) fb - M-halo relation as returned by build_fb_interp(), one per redshift.
+        If given, M_halo, fb and extrapolate are ignored.
+    M_halo : sequence of arrays of float, optional
+        arrays containing the (binned) halo mass for the fb - M-halo relation in M_sun units, one per redshift.
+        For interpolation, out-of-bounds points return NaNs.
+    fb : sequence of arrays of float, optional
+        arrays containing the (binned) baryon fraction normalised by the universal baryon fraction: 
+        f_b / (Omega_b / Omega_m) for the fb - M-halo relation, one per redshift.
+    extrapolate: boolean, default False
+        Whether to extrapolate to out-of-bounds points based on first and last intervals, or to return NaNs.
+    epsilon : float
+        normalization parameter for double power-law form.
+    alpha : float, optional
+        sets the Akino power law constant, or power-law slope at low mass for double power-law form.
+    beta : float, optional
+        sets the Akino power law exponent, or power-law slope at high mass for double power-law form.
+    gamma : float, optional
+        sets the redshift dependence for Akino or double power-law form. 
+    m_pivot : float
+        double power law pivot point in M_sun units.
+    cosmo: astropy cosmology object, optional
+        astropy cosmology object with the desired cosmology
+    k_array : array of float, optional
+        array containing the desired co-moving wavenumber in units [h/Mpc]. If given, k_min, k_max and n are ignored.
+    k_min : float, default 0.1
+        minimum co-moving wavenumber in units [h/Mpc]
+    k_max : float, default 8, max 12
+        maximum co-moving wavenumber in units [h/Mpc].
+    n : int, default 100
+        number of equally spaced co-moving wavenumber in log-spaced between k_min and k_max.
+    errors : boolean, default False
+        enables additional output with the bootstrapped 68% and 95% confidence intervals from statistical errors.
+    verbose : boolean, default True
+        run in verbose mode
+        
+    Returns
+    -------
+    k: array of float
+        array with the co-moving wavenumber in units [h/Mpc]
+    sup: array of float
+        array of shape (len(zs), len(k)) with the suppression of the total matter power spectrum as a function 
+        of redshift and scale
+    error_68_m : array of float, optional
+        array of shape (len(zs), len(k)) with the -1 sigma confidence interval 
+    error_68_p : array of float, optional
+        array of shape (len(zs), len(k)) with the +1 sigma confidence interval 
+    error_95_m : array of float, optional
+        array of shape (len(zs), len(k)) with the -2 sigma confidence interval 
+    error_95_p : array of float, optional
+        array of shape (len(zs), len(k)) with the +2 sigma confidence interval 
+    """
+    zs = _np.asarray(zs, dtype=_np.float64).ravel()
+
+    _check_redshift(zs)
+    k, logk = _get_k(k_array, k_min, k_max, n)
+
+    params = _get_params_batch(SO, zs)
+
+    best_mass = _optimal_mass_funct(logk, params)
+    m_opt = _np.exp(_LN10 * best_mass)
+
+    if (fb_a is not None) or (fb_pow is not None):
+        if verbose:
+            print('\033[36mUsing power-law fit for fb - M_halo \033[0m')
+        if fb_a is None or fb_pow is None:
+            raise ValueError('\033[91mWhen using a power-law, both parameters should be given. '
+                             'Please specify: fb_a and fb_pow \033[0m')
+        fb_a, fb_pow, fb_pivot = (_np.asarray(param, dtype=_np.float64).reshape(-1, 1) 
+                                  for param in (fb_a, fb_pow, fb_pivot))
+        f_b = _power_law(m_opt, fb_a, fb_pow, fb_pivot)
+    elif (fb_interps is not None) or (M_halo is not None) or (fb is not None):
+        if verbose:
+            print('\033[36mUsing binned data for fb - M_halo \033[0m')
+        if fb_interps is None:
+            if M_halo is None or fb is None:
+                raise ValueError('\033[91mWhen using binned data, both halo mass and baryon '
+                                 'fraction should be given. '
+                                 'Please specify: M_halo (array) and fb (array) for each redshift. \033[0m')
+            fb_interps = [build_fb_interp(M_halo_i, fb_i, extrapolate) for M_halo_i, fb_i in zip(M_halo, fb)]
+        if len(fb_interps) != len(zs):
+            raise ValueError('\033[91mWhen using binned data, one fb - M_halo relation '
+                             'should be given for each redshift. \033[0m')
+        f_b = _np.exp(_LN10 * _np.stack([fb_interp(best_mass_i) 
+                                         for fb_interp, best_mass_i in zip(fb_interps, best_mass)]))
+
+    elif (epsilon is not None) or (m_pivot is not None):
+        if verbose:
+            print('\033[36mUsing double power law for fb - M_halo \033[0m')
+        if any(param is None for param in (epsilon, alpha, beta, gamma, m_pivot, cosmo)):
+            raise ValueError('\033[91mUsing double power-law. '
+                             'Please specify: epsilon, alpha, beta, gamma, '
+                             'm_pivot and cosmology (cosmo) \033[0m')
+        f_b = _double_power_law(epsilon, alpha, beta, gamma, m_pivot, m_opt, zs[:, None], cosmo)
+
+    else:
+        if verbose:
+            print('\033[36mUsing an Akino et al. 2022 power-law fit for fb - M_halo \033[0m')
+        if any(param is None for param in (alpha, beta, gamma, cosmo)):
+            raise ValueError('\033[91mUsing an Akino power-law. '
+                             'Please specify: alpha, beta, gamma, and cosmology (cosmo) \033[0m')
+        f_b = _akino(alpha, beta, gamma, m_opt, zs[:, None], cosmo)
+
+    # Fitting limits coefficients, shaped (6, len(zs), 1) to broadcast against the optimal mass.
+    limit_coeffs = _np.array([_get_limit_coeffs(SO, z) for z in zs.tolist()]).T[:, :, None]
+    min_fb, max_fb = _fb_limits(limit_coeffs, best_mass)
+
+    out_min = f_b < min_fb
+    out_max = f_b > max_fb
+    mask = out_min | out_max
+
+    if mask.any():
+        if out_min.any():
+            _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
+                           'fb < lower_limit at z = %s. ' 
+                           'sup_model_batch() will return NaNs within those limits. \033[0m' 
+                           % ', '.join('%.3f' % z for z in zs[out_min.any(axis=1)]), stacklevel=2)
+
+        if out_max.any():
+            _warnings.warn('\033[91mFound baryon fraction values outside fitting limits. '
+                           'fb > upper_limit at z = %s. ' 
+                           'sup_model_batch() will return NaNs within those limits. \033[0m' 
+                           % ', '.join('%.3f' % z for z in zs[out_max.any(axis=1)]), stacklevel=2)
 
     x0 = _lambda_funct(logk, params)
     x1 = _mu_funct(logk, params)
     x2 = _nu_func(logk, params)
-
     sup = x0 - (x0 - x1) * _np.exp(-x2 * f_b)
 
-    sup[mask] = _np.NAN
+    sup[mask] = _np.nan
 
     if errors:
-        raw_table = _pkgutil.get_data(__name__, 'stat_errors_' + str (SO) + '.csv').decode('utf-8').splitlines()
-        table = _np.loadtxt(raw_table, delimiter=",", skiprows=1)
-        coords = table[:, [0, 1, 2]]
-        interp_68_m = _LinearNDInterpolator(coords, table[:, 4], rescale=True)
-        interp_68_p = _LinearNDInterpolator(coords, table[:, 5], rescale=True)
-        interp_95_m = _LinearNDInterpolator(coords, table[:, 6], rescale=True)
-        interp_95_p = _LinearNDInterpolator(coords, table[:, 7], rescale=True)
+        interp_errors = _get_error_interp(SO)
 
-        z_array = _np.full_like(k, z)
-        data = _np.column_stack([k, f_b, z_array])
-        error_68_m = interp_68_m(data)
-        error_68_p = interp_68_p(data)
-        error_95_m = interp_95_m(data)
-        error_95_p = interp_95_p(data)
+        k_grid, z_grid = _np.broadcast_arrays(k, zs[:, None])
+        data = _np.column_stack([k_grid.ravel(), f_b.ravel(), z_grid.ravel()])
+        errs = interp_errors(data).T.reshape(4, len(zs), len(k))
+        error_68_m, error_68_p, error_95_m, error_95_p = errs.copy()
 
         return k, sup, error_68_m, error_68_p, error_95_m, error_95_p
 